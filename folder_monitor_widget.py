@@ -26,15 +26,30 @@ def setup_qt_platform() -> str:
 
 selected_platform = setup_qt_platform()
 
+import bisect
+import ctypes
+import ctypes.util
+import errno
+import hashlib
 import json
+import mmap
+import queue
+import struct
 import time
 import re
 import subprocess
+import tempfile
+import threading
+from array import array
 from datetime import datetime
+from functools import lru_cache
+from operator import itemgetter
+from stat import S_ISDIR
+from types import MappingProxyType
 from pathlib import Path
-from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
 
-from PyQt5.QtCore import Qt, QTimer, QReadWriteLock, pyqtSignal, QObject
+from PyQt5.QtCore import Qt, QTimer, pyqtSignal, QObject, QRunnable, QThreadPool, QSocketNotifier
 from PyQt5.QtGui import QIcon, QPixmap, QPainter, QColor
 from PyQt5.QtWidgets import (
     QApplication, QWidget, QVBoxLayout, QHBoxLayout,
@@ -46,76 +61,575 @@ from PyQt5.QtWidgets import (
 # Constants
 STATE_DIR = Path.home() / ".local/state/folder_monitor"
 LOG_FILE = STATE_DIR / "log.txt"
-SNAPSHOT_FILE = STATE_DIR / "snapshots.json"
+SNAPSHOT_DIR = STATE_DIR / "snapshots"
+SNAPSHOT_FILE = STATE_DIR / "snapshots.json"  # Legacy single-file snapshots, migrated on startup
 FOLDER_LIST_FILE = STATE_DIR / "folders.json"
 LAST_CHECK_FILE = STATE_DIR / "last_check.json"
 WINDOW_STATE_FILE = STATE_DIR / "window_state.json"
 BACKUP_TARGETS_FILE = STATE_DIR / "backup_targets.json"
+LOG_INDEX_FILE = STATE_DIR / "log_index.json"
+
+# Interval strings like '1h30m', '2d4h' (validated on every keystroke)
+_INTERVAL_RE = re.compile(r'(?:\d+[smhd])+')  # validation only: nothing to capture
+_INTERVAL_PARTS_RE = re.compile(r'(\d+)([smhd])')
+_UNIT = MappingProxyType({'s': 1, 'm': 60, 'h': 3600, 'd': 86400})
+
+# Where inotify misses changes (made by other clients, or behind the kernel's back): never watched
+NO_INOTIFY_FILESYSTEMS = ("nfs", "smb", "smb2", "cifs", "ceph", "afs", "9p", "coda", "ncpfs",
+                          "fuse", "fuseblk")
+FULL_SCAN_EVERY = 10  # scheduled checks answered from inotify before a folder is walked in full again
+REFRESH_DELAY_MS = 30  # coalescing window for folder list refreshes
+FILTER_DELAY_MS = 150  # pause in filter typing before the list is filtered
+SAVE_DELAY_MS = 500  # write-back window for bursty state saves
+SCAN_WORKERS = os.cpu_count() or 4  # threads walking the subdirectories of monitored folders
+PARALLEL_SCAN_DEPTH = 3  # directory levels fanned out across scan workers before walking subtrees whole
+
+LOG_INDEX_FLUSH_EVERY = 20  # indexed log entries between index writes
+LOG_COMPACT_THRESHOLD = 200  # superseded log entries tolerated before the log is compacted
 
 STATE_DIR.mkdir(parents=True, exist_ok=True)
+SNAPSHOT_DIR.mkdir(exist_ok=True)
 
 
-def log(msg: str, folder: str = None, operation_type: str = None):
-    # Log a message while maintaining only the last snapshot and check per folder
-    timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    entry = f"[{timestamp}] {msg}\n"
+# Write chunks (bytes-like) to a temporary file next to path, fsync it and rename it over path:
+# a crash leaves either the old or the new content, never a truncated file. The temporary name
+# is unique, so concurrent writers of one path cannot interleave; the last rename wins
+def atomic_write(path: Path, *chunks):
+    fd, tmp_path = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.", suffix=".tmp")
+    try:
+        with open(fd, "wb") as f:
+            f.writelines(chunks)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, path)
+    except BaseException:
+        try:
+            os.unlink(tmp_path)
+        except OSError:
+            pass
+        raise
+
+# Compact separators: no padding spaces to format or write, and the C encoder's fast path
+def dump_json(data) -> bytes:
+    return json.dumps(data, separators=(",", ":")).encode()
+
+def _digest(data: bytes) -> bytes:
+    return hashlib.blake2b(data, digest_size=16).digest()
+
+
+# The log is append-only. The latest entry per (folder, operation) is located through a small
+# sidecar index instead of rewriting the whole file on every call; superseded entries are
+# recorded as stale ranges and dropped by compact_log()
+_log_lock = threading.Lock()
+_LOG_ENTRY_RE = re.compile(r"^\[[^\]]*\] (?:Snapshot updated for (.+)|Changes in (.+):|No changes in (.+))$")
+
+
+def _rebuild_log_index() -> dict:
+    # Recover the index from the log itself (missing or unreadable log_index.json)
+    index = {"entries": {}, "stale": []}
+    current = None  # [folder, operation_type, offset, length] of the entry being read
+    offset = 0
+
+    def close_entry():
+        if current:
+            folder, operation_type, start, length = current
+            ops = index["entries"].setdefault(folder, {})
+            if operation_type in ops:
+                index["stale"].append(ops[operation_type])
+            ops[operation_type] = [start, length]
 
-    # Read existing log if it exists
     try:
-        with open(LOG_FILE, "r") as f:
-            lines = f.readlines()
+        with open(LOG_FILE, "rb") as f:
+            for raw in f:
+                if raw.startswith(b"["):
+                    close_entry()
+                    current = None
+                    match = _LOG_ENTRY_RE.match(raw.decode(errors="replace").rstrip("\n"))
+                    if match:
+                        snapshot_folder, changed_folder, unchanged_folder = match.groups()
+                        if snapshot_folder:
+                            current = [snapshot_folder, "Snapshot", offset, 0]
+                        else:
+                            current = [changed_folder or unchanged_folder, "Check", offset, 0]
+                if current:
+                    current[3] += len(raw)
+                offset += len(raw)
+        close_entry()
     except FileNotFoundError:
-        lines = []
+        pass
+    return index
 
-    # Filter out old entries of the same type for this folder
-    new_lines = []
-    skip_next = False
 
-    for line in lines:
-        # Skip detail lines (those without timestamps)
-        if not line.startswith("["):
-            if skip_next:
-                continue
-            new_lines.append(line)
-            continue
+def _log_file_state():
+    # [inode, size] of log.txt, or None when there is no log
+    try:
+        st = os.stat(LOG_FILE)
+    except FileNotFoundError:
+        return None
+    return [st.st_ino, st.st_size]
 
-        # Check if this is an entry we might want to replace
-        if folder and folder in line:
-            if operation_type and any(op in line for op in ["Snapshot", "Changes", "No changes"]):
-                # This is an operation we want to potentially replace
-                current_op = "Snapshot" if "Snapshot" in line else "Check"
-                if current_op == operation_type:
-                    # Skip this line and its details (we'll add new one)
-                    skip_next = True
-                    continue
 
-        skip_next = False
-        new_lines.append(line)
+def _load_log_index() -> dict:
+    # The index is only trusted for the exact log.txt it was saved with: a log that was deleted,
+    # replaced, or grew after the last index save (crash, SIGKILL) is indexed again from scratch
+    try:
+        with open(LOG_INDEX_FILE, "r") as f:
+            index = json.load(f)
+        if index.get("log_file") != _log_file_state():
+            print(f"[Info] {LOG_INDEX_FILE.name} does not match {LOG_FILE.name}, rebuilding it")
+            return _rebuild_log_index()
+        return {"entries": index["entries"], "stale": index["stale"]}
+    except FileNotFoundError:
+        return _rebuild_log_index()
+    except Exception as e:
+        print(f"[Error] Failed to load {LOG_INDEX_FILE.name}, rebuilding it: {e}")
+        return _rebuild_log_index()
+
+
+# The log stays open for appending between log() calls instead of being reopened for every entry.
+# Each entry is still written out as soon as it is logged. Compaction and clear_log close the
+# handle before they replace or truncate the file
+_log_file = None
+
+
+def _log_handle():
+    # Caller holds _log_lock. _log_state is what log.txt must look like for the index to be right.
+    # If it was deleted, replaced (rotation) or truncated in place (copytruncate) behind our back,
+    # the index offsets no longer match it: drop the handle, which may point to the old inode,
+    # and index the file as it is now
+    global _log_file, _log_state
+    current = _log_file_state()
+    if current != _log_state:
+        _close_log_locked()
+        _log_index.update(_rebuild_log_index())
+        _log_state = current
+        _save_log_index()
+    if _log_file is None:
+        _log_file = open(LOG_FILE, "ab")
+        if _log_state is None:
+            _log_state = _log_file_state()  # just created
+    return _log_file
+
+
+def _close_log_locked():
+    # Caller holds _log_lock
+    global _log_file
+    if _log_file is not None:
+        _log_file.close()
+        _log_file = None
+
+
+def _save_log_index():
+    # Caller holds _log_lock
+    global _log_unsaved
+    try:
+        with open(LOG_INDEX_FILE, "w") as f:
+            json.dump({**_log_index, "log_file": _log_file_state()}, f)
+        _log_unsaved = 0
+    except Exception as e:
+        print(f"[Error] Failed to save {LOG_INDEX_FILE.name}: {e}")
 
-    # Add our new entry
-    new_lines.append(entry)
 
-    # Write back to file
-    with open(LOG_FILE, "w") as f:
-        f.writelines(new_lines)
+_log_index = _load_log_index()
+_log_state = _log_file_state()  # [inode, size] of log.txt as of our last write to it
+_log_unsaved = 0  # index updates not yet flushed to disk
 
-def clear_log():
-    # Clear the log file while keeping one empty line
-    with open(LOG_FILE, "w") as f:
-        f.write("")  # Write empty file
 
-def get_metadata(folder: Path):
-    metadata = {}
-    for root, dirs, files in os.walk(folder):
-        for fname in files:
-            fpath = Path(root) / fname
+def log(msg: str, folder: str = None, operation_type: str = None, details=None):
+    # Append a message (and its untimestamped detail lines) to the log. Entries with a folder
+    # and operation type replace the previous entry of the same type for that folder
+    global _log_unsaved
+    timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+    entry = f"[{timestamp}] {msg}\n"
+    if details:
+        entry += "".join(f"  {line}\n" for line in details)
+    data = entry.encode()
+
+    with _log_lock:
+        f = _log_handle()
+        offset = _log_state[1]
+        f.write(data)
+        f.flush()
+        _log_state[1] += len(data)
+
+        if not (folder and operation_type):
+            return
+
+        ops = _log_index["entries"].setdefault(folder, {})
+        if operation_type in ops:
+            _log_index["stale"].append(ops[operation_type])
+        ops[operation_type] = [offset, len(data)]
+
+        if len(_log_index["stale"]) >= LOG_COMPACT_THRESHOLD:
+            _compact_log_locked()
+        else:
+            _log_unsaved += 1
+            if _log_unsaved >= LOG_INDEX_FLUSH_EVERY:
+                _save_log_index()
+
+
+def _read_indexed_entry(folder: str, operation_type: str):
+    # Caller holds _log_lock. None when the index has no entry, or its range does not hold one
+    location = _log_index["entries"].get(folder, {}).get(operation_type)
+    if not location:
+        return None
+    offset, length = location
+    try:
+        with open(LOG_FILE, "rb") as f:
+            f.seek(offset)
+            data = f.read(length)
+    except FileNotFoundError:
+        return None
+    match = _LOG_ENTRY_RE.match(data.split(b"\n", 1)[0].decode(errors="replace"))
+    if not match:
+        return None
+    snapshot_folder, changed_folder, unchanged_folder = match.groups()
+    entry_folder, entry_type = ((snapshot_folder, "Snapshot") if snapshot_folder
+                                else (changed_folder or unchanged_folder, "Check"))
+    return data if (entry_folder, entry_type) == (folder, operation_type) else None
+
+
+def read_log_entry(folder: str, operation_type: str):
+    # Return the latest entry logged for folder/operation_type (with its details) as raw bytes, or None.
+    # A range that does not hold that entry means the index drifted from the log: rebuild it once
+    with _log_lock:
+        data = _read_indexed_entry(folder, operation_type)
+        if data is None and _log_index["entries"].get(folder, {}).get(operation_type):
+            print(f"[Info] {LOG_INDEX_FILE.name} does not match {LOG_FILE.name}, rebuilding it")
+            _log_index.update(_rebuild_log_index())
+            _save_log_index()
+            data = _read_indexed_entry(folder, operation_type)
+        return data
+
+
+def _compact_log_locked():
+    # Caller holds _log_lock. The live ranges are written straight from a read-only mapping of
+    # the log, so the file is never copied into memory as a whole
+    if not _log_index["stale"]:
+        _save_log_index()  # nothing to drop: leave the file alone
+        return
+    _close_log_locked()  # the file is about to be replaced
+    try:
+        with open(LOG_FILE, "rb") as f:
+            if os.fstat(f.fileno()).st_size:
+                data = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            else:
+                data = b""  # empty files cannot be mapped
+    except FileNotFoundError:
+        data = b""
+    try:
+        with memoryview(data) as view:
+            _compact_mapped_log(view)
+    finally:
+        if isinstance(data, mmap.mmap):
+            data.close()
+
+
+def _compact_mapped_log(data: memoryview):
+    # Copy everything between stale ranges, remembering how many bytes were removed before each cut
+    chunks = []
+    cut_offsets = []
+    removed_before = []
+    pos = 0
+    removed = 0
+    for offset, length in sorted(map(tuple, _log_index["stale"])):
+        if offset < pos or offset + length > len(data):
+            continue
+        chunks.append(data[pos:offset])
+        pos = offset + length
+        removed += length
+        cut_offsets.append(offset)
+        removed_before.append(removed)
+    chunks.append(data[pos:])
+
+    entries = {}
+    for folder, ops in _log_index["entries"].items():
+        for operation_type, (offset, length) in ops.items():
+            if offset + length > len(data):
+                continue  # log was truncated behind our back
+            i = bisect.bisect_right(cut_offsets, offset)
+            shift = removed_before[i - 1] if i else 0
+            entries.setdefault(folder, {})[operation_type] = [offset - shift, length]
+
+    global _log_state
+    try:
+        atomic_write(LOG_FILE, *chunks)
+        _log_state = _log_file_state()
+    except Exception as e:
+        print(f"[Error] Failed to compact {LOG_FILE.name}: {e}")
+        return
+    finally:
+        # Release the slices so the mapping can be closed
+        for chunk in chunks:
+            chunk.release()
+
+    _log_index["entries"] = entries
+    _log_index["stale"] = []
+    _save_log_index()
+
+
+def compact_log():
+    # Drop superseded entries from the log file and flush the index
+    with _log_lock:
+        _compact_log_locked()
+
+def clear_log():
+    # Clear the log file and its index
+    global _log_state
+    with _log_lock:
+        _close_log_locked()
+        with open(LOG_FILE, "w") as f:
+            f.write("")  # Write empty file
+        _log_state = _log_file_state()
+        _log_index["entries"] = {}
+        _log_index["stale"] = []
+        _save_log_index()
+
+# Scan one directory with os.scandir: keys are plain DirEntry.path strings (no Path objects),
+# directories are classified from the dirent type and symlinks are recorded as links
+# (lstat), so every entry costs at most one stat() call and dangling links are not errors.
+# Files are reported through record(path, (mtime, size))
+def _scan_dir(path: str, record, subdirs: list):
+    try:
+        it = os.scandir(path)
+    except OSError:
+        # Unreadable directories are skipped silently, like os.walk did
+        return
+    with it:
+        for entry in it:
             try:
-                stat = fpath.stat()
-                metadata[str(fpath)] = (stat.st_mtime, stat.st_size)
+                if entry.is_dir(follow_symlinks=False):
+                    subdirs.append(entry.path)
+                    continue
+                stat = entry.stat(follow_symlinks=False)
+                record(entry.path, (stat.st_mtime, stat.st_size))
             except Exception as e:
-                log(f"Error accessing {fpath}: {e}")
+                log(f"Error accessing {entry.path}: {e}")
+
+def _scan_subtree(top: str, record):
+    stack = [top]
+    while stack:
+        _scan_dir(stack.pop(), record, stack)
+
+# Directories shallower than PARALLEL_SCAN_DEPTH are scanned one level at a time and their
+# subdirectories handed back to _walk for dispatch; deeper ones are walked whole
+def _scan_task(path: str, depth: int, record):
+    if depth < PARALLEL_SCAN_DEPTH:
+        subdirs = []
+        _scan_dir(path, record, subdirs)
+        return subdirs, depth
+    _scan_subtree(path, record)
+    return (), depth
+
+# stat() releases the GIL, so the subdirectories of a folder are walked concurrently, breadth-first
+# down to PARALLEL_SCAN_DEPTH so one big subdirectory does not leave the other workers idle.
+# Scan tasks never wait on other tasks, so this pool cannot starve itself
+_scan_pool = ThreadPoolExecutor(max_workers=SCAN_WORKERS, thread_name_prefix="folder_scan")
+
+# record is called from several scan workers at once: it must only do GIL-atomic updates
+def _walk(folder, record):
+    subdirs = []
+    _scan_dir(str(folder), record, subdirs)
+    pending = {_scan_pool.submit(_scan_task, path, 1, record) for path in subdirs}
+    while pending:
+        done, pending = wait(pending, return_when=FIRST_COMPLETED)
+        for future in done:
+            subdirs, depth = future.result()
+            pending.update(_scan_pool.submit(_scan_task, path, depth + 1, record) for path in subdirs)
+
+# With the snapshot being replaced as previous, paths it already has are stored under its key
+# strings rather than as fresh equal copies. A per-walk lookup, not sys.intern: interned strings
+# are immortal on CPython 3.12 and paths of deleted files would pile up for good
+def get_metadata(folder: Path, previous: dict = None):
+    metadata = {}
+    if previous:
+        keys = {path: path for path in previous}
+        _walk(folder, lambda path, meta: metadata.__setitem__(keys.get(path, path), meta))
+    else:
+        _walk(folder, metadata.__setitem__)
     return metadata
 
+# Compares files against a snapshot as the walk reports them, so checking a folder does not
+# build (and throw away) a full metadata dict. Only list appends: safe from several workers
+class _TreeDiff:
+    def __init__(self, previous: dict):
+        self.previous = previous
+        self.new = []
+        self.modified = []
+        self.seen = []  # paths also in the snapshot
+
+    def record(self, path, meta):
+        previous = self.previous.get(path)
+        if previous is None:
+            self.new.append(path)
+            return
+        self.seen.append(path)
+        if previous != meta:
+            self.modified.append(path)
+
+# Returns the formatted change lines and the changed paths themselves (new, modified, deleted)
+def scan_and_diff(folder, previous: dict):
+    diff = _TreeDiff(previous)
+    _walk(folder, diff.record)
+    # Every snapshot path was seen: nothing was deleted, no set to build
+    deleted = previous.keys() - set(diff.seen) if len(diff.seen) < len(previous) else ()
+    changed_files = format_changes(diff.new, diff.modified, deleted)
+    return changed_files, [*diff.new, *diff.modified, *deleted]
+
+# Snapshots are stored one file per folder, as structure-of-arrays:
+# header | NUL-separated path blob | float64 mtimes | int64 sizes, all little-endian so a state
+# directory can move between machines
+_SNAPSHOT_MAGIC = b"FMS1"
+_SNAPSHOT_HEADER = struct.Struct("<4sQQ")  # magic, file count, path blob length
+
+
+def snapshot_path(folder: str) -> Path:
+    return SNAPSHOT_DIR / f"{hashlib.blake2b(folder.encode()).hexdigest()[:16]}.bin"
+
+
+# Returns False (after logging) when the snapshot could not be written
+def save_snapshot(folder: str, metadata: dict) -> bool:
+    blob = "\0".join(metadata).encode("utf-8", "surrogateescape")
+    mtimes = array("d", [mtime for mtime, _ in metadata.values()])
+    sizes = array("q", [size for _, size in metadata.values()])
+    if sys.byteorder != "little":
+        mtimes.byteswap()
+        sizes.byteswap()
+    try:
+        header = _SNAPSHOT_HEADER.pack(_SNAPSHOT_MAGIC, len(metadata), len(blob))
+        atomic_write(snapshot_path(folder), header, blob, mtimes, sizes)
+    except Exception as e:
+        log(f"Error saving snapshot for {folder}: {e}")
+        return False
+    return True
+
+
+def load_snapshot(folder: str) -> dict:
+    try:
+        data = snapshot_path(folder).read_bytes()
+    except FileNotFoundError:
+        return {}
+
+    try:
+        magic, count, blob_len = _SNAPSHOT_HEADER.unpack_from(data)
+        if magic != _SNAPSHOT_MAGIC:
+            raise ValueError("not a snapshot file")
+        if not count:
+            return {}
+        start = _SNAPSHOT_HEADER.size
+        paths = data[start:start + blob_len].decode("utf-8", "surrogateescape").split("\0")
+        start += blob_len
+        mtimes = array("d")
+        mtimes.frombytes(data[start:start + count * mtimes.itemsize])
+        start += count * mtimes.itemsize
+        sizes = array("q")
+        sizes.frombytes(data[start:start + count * sizes.itemsize])
+        if not len(paths) == len(mtimes) == len(sizes) == count:
+            raise ValueError("truncated snapshot file")
+        if sys.byteorder != "little":
+            mtimes.byteswap()
+            sizes.byteswap()
+    except Exception as e:
+        log(f"Error loading snapshot for {folder}: {e}")
+        return {}
+    return dict(zip(paths, zip(mtimes, sizes)))
+
+
+def delete_snapshot(folder: str):
+    try:
+        snapshot_path(folder).unlink()
+    except FileNotFoundError:
+        pass
+
+
+def migrate_legacy_snapshots():
+    # Split the old snapshots.json ({folder: {path: [mtime, size]}}) into per-folder files
+    if not SNAPSHOT_FILE.exists():
+        return
+    try:
+        with open(SNAPSHOT_FILE, "r") as f:
+            legacy = json.load(f)
+        failed = [folder for folder, metadata in legacy.items() if not save_snapshot(folder, metadata)]
+        if failed:
+            # Keep the old file: the migration is retried on the next start
+            log(f"Error migrating {SNAPSHOT_FILE.name}: {len(failed)} of {len(legacy)} snapshots "
+                f"could not be written, keeping it")
+            return
+        SNAPSHOT_FILE.unlink()
+        print(f"[Info] Migrated {len(legacy)} snapshots to {SNAPSHOT_DIR}")
+    except Exception as e:
+        log(f"Error migrating {SNAPSHOT_FILE.name}: {e}")
+
+# Compare two {path: (mtime, size)} mappings. Key-view set operations and a single
+# comprehension keep the per-file work in C; only changed paths are formatted
+def diff_metadata(previous: dict, current: dict) -> list:
+    new = current.keys() - previous.keys()
+    deleted = previous.keys() - current.keys()
+    # previous.get(path, meta) is meta for new paths, so they are not reported twice
+    modified = [path for path, meta in current.items() if previous.get(path, meta) != meta]
+    return format_changes(new, modified, deleted)
+
+def format_changes(new, modified, deleted) -> list:
+    changed_files = [f"NEW: {path}" for path in sorted(new)]
+    changed_files += [f"MODIFIED: {path}" for path in sorted(modified)]
+    changed_files += [f"DELETED: {path}" for path in sorted(deleted)]
+    return changed_files
+
+# Re-stat only the paths inotify reported since the last snapshot. Returns the snapshot entries and
+# the current metadata for just that part of the tree, ready for diff_metadata(). Directories that
+# appeared are scanned, paths that disappeared may have been directories: their snapshot entries
+# are matched by prefix
+def dirty_metadata(previous: dict, dirty: set):
+    current = {}
+    prefixes = []
+    for path in dirty:
+        try:
+            stat = os.lstat(path)
+        except OSError:
+            prefixes.append(path + os.sep)
+            continue
+        if S_ISDIR(stat.st_mode):
+            prefixes.append(path + os.sep)
+            _scan_subtree(path, current.__setitem__)
+        else:
+            current[path] = (stat.st_mtime, stat.st_size)
+
+    subset = {path: previous[path] for path in dirty if path in previous}
+    if prefixes:
+        prefixes = tuple(prefixes)
+        subset.update((path, meta) for path, meta in previous.items() if path.startswith(prefixes))
+    return subset, current
+
+# Open a file or folder with the desktop default application, without a shell and without
+# waiting for xdg-open (which can take a while to resolve the handler) to return
+def xdg_open(target):
+    try:
+        subprocess.Popen(['xdg-open', str(target)], start_new_session=True,
+                         stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    except OSError as e:
+        log(f"Error opening {target}: {e}")
+
+# Check times repeat across rows and refreshes (run_check_all stamps every folder alike)
+@lru_cache(maxsize=4096)
+def format_timestamp(ts: int) -> str:
+    return datetime.fromtimestamp(ts).strftime("%Y-%m-%d %H:%M:%S")
+
+def filesystem_type(path) -> str:
+    try:
+        result = subprocess.run(["stat", "-f", "-c", "%T", str(path)], check=True,
+                                stdout=subprocess.PIPE, stderr=subprocess.DEVNULL, text=True)
+        return result.stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return ""
+
+# An unknown filesystem type counts as unreliable: such folders are simply walked in full
+def inotify_reliable(path) -> bool:
+    fs_type = filesystem_type(path)
+    return bool(fs_type) and fs_type not in NO_INOTIFY_FILESYSTEMS and not fs_type.startswith("fuse.")
+
+# Only a handful of (symbol, color) pairs are ever used, so paint each one once and share the QIcon.
+# Painting happens on the first call, when a QApplication exists
+@lru_cache(maxsize=16)
 def colored_icon(symbol: str, color: str) -> QIcon:
     pixmap = QPixmap(32, 32)
     pixmap.fill(Qt.transparent)
@@ -128,9 +642,256 @@ def colored_icon(symbol: str, color: str) -> QIcon:
 
     return QIcon(pixmap)
 
+# Sort keys for the folder list, picked once per refresh. Rows are
+# (lowercased folder, interval, last check time, status rank, folder, text, status) tuples
+_SORT_KEYS = {
+    "Folder": itemgetter(0),
+    "Interval": itemgetter(1),
+    "Last Checked": itemgetter(2),
+    "Status": itemgetter(3),
+}
+
 class FolderSignals(QObject):
-    operation_started = pyqtSignal(str)  # folder path
-    operation_finished = pyqtSignal(str)  # folder path
+    operations_changed = pyqtSignal(set, set)  # folders started, folders finished
+    # Workers never touch self.snapshots: they hand metadata to the GUI thread, its only writer
+    snapshot_taken = pyqtSignal(str, object)  # folder path, metadata
+    snapshot_loaded = pyqtSignal(str, object)  # folder path, metadata read from disk
+    status_changed = pyqtSignal(str, str)  # folder path, "ok"/"changed"
+
+# inotify(7) constants
+IN_MODIFY = 0x00000002
+IN_ATTRIB = 0x00000004
+IN_MOVED_FROM = 0x00000040
+IN_MOVED_TO = 0x00000080
+IN_CREATE = 0x00000100
+IN_DELETE = 0x00000200
+IN_DELETE_SELF = 0x00000400
+IN_MOVE_SELF = 0x00000800
+IN_Q_OVERFLOW = 0x00004000
+IN_IGNORED = 0x00008000
+IN_ONLYDIR = 0x01000000
+IN_DONT_FOLLOW = 0x02000000
+IN_ISDIR = 0x40000000
+_INOTIFY_EVENT = struct.Struct("iIII")  # wd, mask, cookie, len (name follows)
+_WATCH_MASK = (IN_MODIFY | IN_ATTRIB | IN_MOVED_FROM | IN_MOVED_TO | IN_CREATE | IN_DELETE
+               | IN_DELETE_SELF | IN_MOVE_SELF | IN_ONLYDIR | IN_DONT_FOLLOW)
+
+# Tracks, per monitored folder, the paths the kernel reported as changed since the last snapshot,
+# so check_folder can re-stat those instead of walking the whole tree. A folder's dirty set is only
+# trusted once a full walk has been made with its watches in place (trust()); until then, and after
+# a queue overflow or when the watch limit is hit, dirty_paths() returns None and checks fall back
+# to a full walk.
+# Events are read on the GUI thread when the Qt event loop sees the inotify fd become readable;
+# worker threads only query and update the watch state, under _lock
+class InotifyWatcher(QObject):
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._libc = ctypes.CDLL(ctypes.util.find_library("c"), use_errno=True)
+        self._fd = self._libc.inotify_init1(os.O_NONBLOCK | os.O_CLOEXEC)
+        if self._fd < 0:
+            err = ctypes.get_errno()
+            raise OSError(err, os.strerror(err))
+        self._lock = threading.Lock()
+        self._wd_paths = {}  # watch descriptor -> watched directory
+        self._folders = set()  # folders with watches in place
+        self._unwatchable = set()  # folders that could not be watched; full walks only
+        self._dirty = {}  # watched folder -> paths reported since its last snapshot
+        self._trusted = set()  # folders whose dirty set covers every difference from the snapshot
+        self._overflows = 0  # event queue overflows so far
+        self._walk_overflows = {}  # folder -> _overflows when its current full walk started
+        self._notifier = QSocketNotifier(self._fd, QSocketNotifier.Read, self)
+        self._notifier.activated.connect(self._read_events)
+
+    def _add_watches(self, top: str) -> bool:
+        # Caller holds _lock. Watch top and every directory below it. A directory on another device
+        # than its parent is a mount point: if it is a network/FUSE mount, the tree cannot be watched
+        try:
+            stack = [(top, os.stat(top).st_dev)]
+        except OSError:
+            return True  # removed meanwhile; the event that removed it marks it dirty
+        while stack:
+            path, device = stack.pop()
+            wd = self._libc.inotify_add_watch(self._fd, os.fsencode(path), _WATCH_MASK)
+            if wd < 0:
+                err = ctypes.get_errno()
+                if err in (errno.ENOENT, errno.ENOTDIR):
+                    continue  # removed meanwhile; the event that removed it marks it dirty
+                log(f"Cannot watch {path}: {os.strerror(err)}")
+                return False
+            self._wd_paths[wd] = path
+            try:
+                with os.scandir(path) as it:
+                    for entry in it:
+                        if not entry.is_dir(follow_symlinks=False):
+                            continue
+                        entry_device = entry.stat(follow_symlinks=False).st_dev
+                        if entry_device != device and not inotify_reliable(entry.path):
+                            log(f"Cannot watch {entry.path}: network, FUSE or unknown filesystem")
+                            return False
+                        stack.append((entry.path, entry_device))
+            except OSError:
+                pass
+        return True
+
+    def _remove_watches(self, top: str):
+        # Caller holds _lock. Drop watches on top and below, unless another folder still needs them
+        prefix = top + os.sep
+        for wd, path in list(self._wd_paths.items()):
+            if path != top and not path.startswith(prefix):
+                continue
+            if any(path == folder or path.startswith(folder + os.sep) for folder in self._folders):
+                continue
+            self._libc.inotify_rm_watch(self._fd, wd)
+            del self._wd_paths[wd]
+
+    def _forget(self, folder: str):
+        # Caller holds _lock
+        self._folders.discard(folder)
+        self._dirty.pop(folder, None)
+        self._trusted.discard(folder)
+        self._walk_overflows.pop(folder, None)
+        self._remove_watches(folder)
+
+    def _give_up(self, folder: str):
+        # Caller holds _lock
+        self._forget(folder)
+        self._unwatchable.add(folder)
+        log(f"Watching {folder} failed, falling back to full scans")
+
+    def watch(self, folder: str) -> bool:
+        # Make sure folder is watched and its changes recorded; a full walk is about to start.
+        # Returns False when it cannot be (network/FUSE filesystem, watch limit, permissions)
+        with self._lock:
+            if folder in self._folders:
+                self._walk_overflows[folder] = self._overflows
+                return True
+            if folder in self._unwatchable:
+                return False
+        if not os.path.isdir(folder):
+            # Not there right now (drive not mounted yet, root being re-created): not cached,
+            # the next walk asks again
+            return False
+        if not inotify_reliable(folder):
+            with self._lock:
+                self._unwatchable.add(folder)
+            log(f"Not watching {folder}: network, FUSE or unknown filesystem, using full scans")
+            return False
+        with self._lock:
+            if folder in self._folders:
+                self._walk_overflows[folder] = self._overflows
+                return True
+            if folder in self._unwatchable:
+                return False
+            self._folders.add(folder)
+            self._dirty[folder] = set()
+            self._walk_overflows[folder] = self._overflows
+            if not self._add_watches(folder):
+                self._give_up(folder)
+                return False
+            return True
+
+    def unwatch(self, folder: str):
+        with self._lock:
+            self._forget(folder)
+            self._unwatchable.discard(folder)
+
+    def reset(self, folder: str):
+        # A snapshot walk is starting: what it misses from now on will be reported by the kernel
+        with self._lock:
+            if folder in self._folders:
+                self._dirty[folder] = set()
+                self._trusted.discard(folder)
+                self._walk_overflows[folder] = self._overflows
+
+    def trust(self, folder: str, paths=()):
+        # A full walk (started after watch()) just finished; paths are the differences it found.
+        # If events were lost while it ran, changes to paths it had already passed went unseen:
+        # the folder stays untrusted until a walk completes without an overflow
+        with self._lock:
+            if folder in self._folders and self._walk_overflows.get(folder) == self._overflows:
+                self._dirty[folder].update(paths)
+                self._trusted.add(folder)
+
+    def dirty_paths(self, folder: str):
+        with self._lock:
+            return set(self._dirty[folder]) if folder in self._trusted else None
+
+    def stop(self):
+        self._notifier.setEnabled(False)
+        os.close(self._fd)
+
+    def _read_events(self):
+        # A worker may be holding the lock while it adds watches on a large tree: rather than block
+        # the GUI, leave the events queued in the kernel and look again shortly
+        if not self._lock.acquire(blocking=False):
+            self._notifier.setEnabled(False)
+            QTimer.singleShot(50, lambda: self._notifier.setEnabled(True))
+            return
+        try:
+            while True:
+                try:
+                    data = os.read(self._fd, 64 * 1024)
+                except BlockingIOError:
+                    break
+                self._handle_events(data)
+        finally:
+            self._lock.release()
+
+    def _handle_events(self, data: bytes):
+        # Caller holds _lock
+        offset = 0
+        while offset < len(data):
+            wd, mask, _cookie, length = _INOTIFY_EVENT.unpack_from(data, offset)
+            offset += _INOTIFY_EVENT.size
+            name = os.fsdecode(data[offset:offset + length].rstrip(b"\0"))
+            offset += length
+
+            if mask & IN_Q_OVERFLOW:
+                # Events were lost: nothing can be trusted until the next full walk, and walks
+                # running now do not count
+                self._overflows += 1
+                self._trusted.clear()
+                continue
+            if mask & IN_IGNORED:
+                self._wd_paths.pop(wd, None)
+                continue
+            directory = self._wd_paths.get(wd)
+            if directory is None:
+                continue
+
+            if not name:
+                # Event on a watched directory itself; its parent reports the entry, except for a
+                # monitored folder's root, which needs watching again once it reappears
+                if mask & (IN_DELETE_SELF | IN_MOVE_SELF) and directory in self._folders:
+                    self._forget(directory)
+                continue
+
+            path = os.path.join(directory, name)
+            if mask & IN_ISDIR:
+                if mask & (IN_CREATE | IN_MOVED_TO):
+                    if not self._add_watches(path):
+                        for folder in [f for f in self._folders if path.startswith(f + os.sep)]:
+                            self._give_up(folder)
+                elif not mask & (IN_DELETE | IN_MOVED_FROM):
+                    continue  # attribute change on a directory: not part of the metadata
+
+            for folder, dirty in self._dirty.items():
+                if path.startswith(folder + os.sep):
+                    dirty.add(path)
+
+# Runs fn(*args) on a QThreadPool worker
+class Task(QRunnable):
+    def __init__(self, fn, *args):
+        super().__init__()
+        self.fn = fn
+        self.args = args
+
+    def run(self):
+        # An exception escaping a QRunnable aborts the application, so log it instead
+        try:
+            self.fn(*self.args)
+        except Exception as e:
+            log(f"Error in background task {self.fn.__name__}: {e}")
 
 class IntervalInputDialog(QDialog):
     def __init__(self, folder: str, parent=None):
@@ -166,8 +927,7 @@ class IntervalInputDialog(QDialog):
         self.setLayout(layout)
 
     def validate_input(self, text):
-        pattern = r"^(\d+[smhd])+$"
-        self.valid = re.fullmatch(pattern, text.strip().lower()) is not None
+        self.valid = _INTERVAL_RE.fullmatch(text.strip().lower()) is not None
         self.ok_btn.setEnabled(self.valid)
 
     def get_interval(self):
@@ -181,26 +941,54 @@ class FolderMonitorWidget(QWidget):
         #self.resize(500, 400)  # Optional: set initial size
         #self.setMinimumWidth(150)  # Optionnal : set minimum size
 
-        self.snapshots = self.load_json(SNAPSHOT_FILE)
+        self._saved_digests = {}  # path -> digest of the JSON last loaded from/saved to it
+        self._pending_saves = {}  # path -> data, written by flush_saves()
+        self._save_timer = QTimer(self)
+        self._save_timer.setSingleShot(True)
+        self._save_timer.setInterval(SAVE_DELAY_MS)
+        self._save_timer.timeout.connect(self.flush_saves)
+        migrate_legacy_snapshots()
         self.folder_intervals = self.load_json(FOLDER_LIST_FILE)
+        self.snapshots = {}  # folder -> metadata, loaded from disk on first use (get_snapshot)
         self.last_check_times = self.load_json(LAST_CHECK_FILE)
         self.backup_targets = self.load_backup_targets()
         self.folder_statuses = {}
         self.active_operations = set()  # Track folders with ongoing operations
+        self._checks_since_full_scan = {}  # folder -> scheduled checks answered from inotify
         self.signals = FolderSignals()
-        self.executor = ThreadPoolExecutor()
-
-        #Thread safety
-        self.snapshots_lock = QReadWriteLock()
-        self.folder_intervals_lock = QReadWriteLock()
-        self.last_check_times_lock = QReadWriteLock()
+        self.thread_pool = QThreadPool.globalInstance()
+        try:
+            self.watcher = InotifyWatcher(self)
+        except (OSError, AttributeError) as e:
+            # No inotify (not Linux, or no libc): every check walks the whole tree
+            print(f"[Info] inotify unavailable, using full scans: {e}")
+            self.watcher = None
+
+        # Coalesce bursts of refresh requests (e.g. one per started/finished operation) into one redraw
+        self._folder_items = {}  # folder -> (QListWidgetItem, text, icon) currently shown
+        # folder -> (interval, last check, row text, lowercased filter text, lowercased folder),
+        # rebuilt when either input changes
+        self._row_text_cache = {}
+
+        # Workers report finished operations through a queue, drained while operations are running,
+        # instead of posting one cross-thread signal each
+        self._finished_operations = queue.SimpleQueue()
+        self._operations_timer = QTimer(self)
+        self._operations_timer.setInterval(10)
+        self._operations_timer.timeout.connect(self._drain_finished_operations)
+        self._refresh_timer = QTimer(self)
+        self._refresh_timer.setSingleShot(True)
+        self._refresh_timer.timeout.connect(self._do_refresh_folder_list)
+        self._refreshing = False
 
         self.setup_ui(qt_platform)
         self.refresh_folder_list()
 
         # Connect signals
-        self.signals.operation_started.connect(self.on_operation_started)
-        self.signals.operation_finished.connect(self.on_operation_finished)
+        self.signals.operations_changed.connect(self.on_operations_changed)
+        self.signals.snapshot_taken.connect(self.on_snapshot_taken)
+        self.signals.snapshot_loaded.connect(self.on_snapshot_loaded)
+        self.signals.status_changed.connect(self.on_status_changed)
 
         self.timer = QTimer(self)
         self.timer.timeout.connect(self.check_due_folders)  # This used to be commented for some reason ?!
@@ -256,7 +1044,7 @@ class FolderMonitorWidget(QWidget):
 
         self.filter_input = QLineEdit()
         self.filter_input.setPlaceholderText("Filter by folder, interval, or last check...")
-        self.filter_input.textChanged.connect(self.refresh_folder_list)
+        self.filter_input.textChanged.connect(self.on_filter_changed)
 
         self.sort_dropdown = QComboBox()
         self.sort_dropdown.addItems(["Folder", "Interval", "Last Checked", "Status"])
@@ -321,18 +1109,9 @@ class FolderMonitorWidget(QWidget):
             self.folder_input.setText(folder)
         return folder
 
-    # Converts multi unit intervals to seconds
-    def parse_multiunit_interval(self, s: str) -> int:
-        """Parses strings like '1h30m', '2d4h' into seconds."""
-        unit_multipliers = {'s': 1, 'm': 60, 'h': 3600, 'd': 86400}
-        total = 0
-        for number, unit in re.findall(r'(\d+)([smhd])', s):
-            total += int(number) * unit_multipliers[unit]
-        return total
-
     def validate_interval_input(self):
         text = self.time_input.text().strip().lower()
-        is_valid = bool(re.fullmatch(r'(\d+[smhd])+', text))
+        is_valid = bool(_INTERVAL_RE.fullmatch(text))
         self.add_btn.setEnabled(is_valid)
 
     # Context menu logic
@@ -395,7 +1174,7 @@ class FolderMonitorWidget(QWidget):
 
         if action == backupMenuManage:
             # For Linux
-            subprocess.run(['xdg-open', BACKUP_TARGETS_FILE])
+            xdg_open(BACKUP_TARGETS_FILE)
 
     # Calls personnal script: rsync_backup_manager
     def backup(self, source, destination):
@@ -430,7 +1209,7 @@ class FolderMonitorWidget(QWidget):
         folder = self.folder_input.text().strip()
         interval_str = self.time_input.text().strip().lower()
 
-        if not folder or not re.fullmatch(r'(\d+[smhd])+', interval_str):
+        if not folder or not _INTERVAL_RE.fullmatch(interval_str):
             return
 
         folder_path = Path(folder).resolve()
@@ -442,7 +1221,7 @@ class FolderMonitorWidget(QWidget):
             QMessageBox.warning(self, "Duplicate", "Folder is already being monitored.")
             return
 
-        interval = self.parse_multiunit_interval(interval_str)
+        interval = self.parse_interval_input(interval_str)
         self.folder_intervals[folder_str] = interval
         self.last_check_times[folder_str] = 0
 
@@ -451,37 +1230,51 @@ class FolderMonitorWidget(QWidget):
         self.refresh_folder_list()
 
     def refresh_folder_list(self):
-        self.folder_list.clear()
+        # Restarting the single-shot timer is idempotent, so callers can ask for refreshes freely
+        self._refresh_timer.start(REFRESH_DELAY_MS)
+
+    def on_filter_changed(self):
+        # Wait for a pause in typing instead of filtering on every keystroke
+        self._refresh_timer.start(FILTER_DELAY_MS)
+
+    def _do_refresh_folder_list(self):
+        if self._refreshing:
+            # Something inside the refresh spun the event loop: go again once it is done
+            self._refresh_timer.start(REFRESH_DELAY_MS)
+            return
+        self._refreshing = True
+        try:
+            self._rebuild_folder_list()
+        finally:
+            self._refreshing = False
+
+    def _rebuild_folder_list(self):
         filter_text = self.filter_input.text().strip().lower()
         sort_by = self.sort_dropdown.currentText()
 
-        def sort_key(item):
-            folder, interval = item
-            status = self.folder_statuses.get(folder, "ok")
-            last_checked = self.last_check_times.get(folder, 0)
-            if sort_by == "Folder":
-                return folder.lower()
-            elif sort_by == "Interval":
-                return interval
-            elif sort_by == "Last Checked":
-                return last_checked
-            elif sort_by == "Status":
-                return 0 if status == "ok" else 1
-            return folder.lower()
-
-        sorted_folders = sorted(self.folder_intervals.items(), key=sort_key)
-
-        for folder, interval in sorted_folders:
+        # Filter first, then sort only the rows that are shown, on keys computed once per row
+        visible = []
+        for folder, interval in self.folder_intervals.items():
             last_checked_ts = self.last_check_times.get(folder, 0)
-            last_checked_str = datetime.fromtimestamp(last_checked_ts).strftime("%Y-%m-%d %H:%M:%S") if last_checked_ts else "never"
-            interval_str = self.interval_label(interval)
+            cached = self._row_text_cache.get(folder)
+            if cached is None or cached[0] != interval or cached[1] != last_checked_ts:
+                last_checked_str = format_timestamp(int(last_checked_ts)) if last_checked_ts else "never"
+                interval_str = self.interval_label(interval)
+                text = f"{folder}\n  Interval: {interval_str} | Last check: {last_checked_str}"
+                combined_text = f"{folder} {interval_str} {last_checked_str}".lower()
+                cached = self._row_text_cache[folder] = (interval, last_checked_ts, text, combined_text,
+                                                         folder.lower())
+            _, _, text, combined_text, folder_lower = cached
 
-            combined_text = f"{folder} {interval_str} {last_checked_str}".lower()
             if filter_text and filter_text not in combined_text:
                 continue
 
             status = self.folder_statuses.get(folder, "ok")
+            visible.append((folder_lower, interval, last_checked_ts, status != "ok", folder, text, status))
+        visible.sort(key=_SORT_KEYS.get(sort_by, _SORT_KEYS["Folder"]))
 
+        rows = []
+        for _, _, _, _, folder, text, status in visible:
             # Determine which icon to show
             if folder in self.active_operations:
                 symbol = "↻"  # Loading spinner (not animated)
@@ -490,10 +1283,38 @@ class FolderMonitorWidget(QWidget):
                 symbol = "✔" if status == "ok" else "❌"
                 color = "green" if status == "ok" else "red"
 
-            text = f"{folder}\n  Interval: {interval_str} | Last check: {last_checked_str}"
-            item = QListWidgetItem(text)
-            item.setIcon(colored_icon(symbol, color))
-            self.folder_list.addItem(item)
+            rows.append((folder, text, colored_icon(symbol, color)))
+
+        # Update the existing items in place instead of clearing and rebuilding the whole list.
+        # Items are only touched where the text, icon or position differs from what is shown,
+        # and painting is suspended until the list is consistent again
+        self.folder_list.setUpdatesEnabled(False)
+        try:
+            shown = {folder for folder, _, _ in rows}
+            for folder in [f for f in self._folder_items if f not in shown]:
+                item = self._folder_items.pop(folder)[0]
+                self.folder_list.takeItem(self.folder_list.row(item))
+
+            for row, (folder, text, icon) in enumerate(rows):
+                state = self._folder_items.get(folder)
+                if state is None:
+                    item = QListWidgetItem(text)
+                    item.setIcon(icon)
+                    self.folder_list.insertItem(row, item)
+                    self._folder_items[folder] = (item, text, icon)
+                    continue
+
+                item, shown_text, shown_icon = state
+                if self.folder_list.item(row) is not item:
+                    self.folder_list.takeItem(self.folder_list.row(item))
+                    self.folder_list.insertItem(row, item)
+                if shown_text != text:
+                    item.setText(text)
+                if shown_icon is not icon:
+                    item.setIcon(icon)
+                self._folder_items[folder] = (item, text, icon)
+        finally:
+            self.folder_list.setUpdatesEnabled(True)
 
     def update_folder_interval(self, folder):
         dialog = IntervalInputDialog(folder, self)
@@ -508,23 +1329,22 @@ class FolderMonitorWidget(QWidget):
                 except ValueError as e:
                     QMessageBox.warning(self, "Invalid Format", str(e))
 
+    # Converts multi unit intervals to seconds
     def parse_interval_input(self, input_str):
-        input_str = input_str.strip().lower()
-        pattern = r"(\d+)([smhd])"
-        matches = re.findall(pattern, input_str)
+        """Parses strings like '1h30m', '2d4h' into seconds."""
+        matches = _INTERVAL_PARTS_RE.findall(input_str.strip().lower())
 
         if not matches:
             raise ValueError("Invalid interval format. Use combinations like '1h30m', '2d4h', etc.")
 
-        unit_seconds = {"s": 1, "m": 60, "h": 3600, "d": 86400}
         total_seconds = 0
         for value, unit in matches:
-            total_seconds += int(value) * unit_seconds[unit]
+            total_seconds += int(value) * _UNIT[unit]
 
         return total_seconds
 
     def open_folder(self, folder):
-        os.system(f'xdg-open "{folder}"')
+        xdg_open(folder)
 
     def remove_folder(self, folder):
         confirm = QMessageBox.question(self, "Confirm Delete",
@@ -537,9 +1357,13 @@ class FolderMonitorWidget(QWidget):
         self.last_check_times.pop(folder, None)
         self.folder_statuses.pop(folder, None)
         self.active_operations.discard(folder)
+        self._row_text_cache.pop(folder, None)
+        self._checks_since_full_scan.pop(folder, None)
 
         self.save_json(FOLDER_LIST_FILE, self.folder_intervals)
-        self.save_json(SNAPSHOT_FILE, self.snapshots)
+        delete_snapshot(folder)
+        if self.watcher:
+            self.thread_pool.start(Task(self.watcher.unwatch, folder))
         self.save_json(LAST_CHECK_FILE, self.last_check_times)
 
         self.refresh_folder_list()
@@ -547,9 +1371,11 @@ class FolderMonitorWidget(QWidget):
     def check_single_folder(self, folder):
         now = time.time()
         self.last_check_times[folder] = now
-        self.save_json(LAST_CHECK_FILE, self.last_check_times)
-        self.signals.operation_started.emit(folder)
-        self.executor.submit(self.check_folder, folder)
+        self.schedule_save(LAST_CHECK_FILE, self.last_check_times)
+        self.signals.operations_changed.emit({folder}, set())
+        # Checks the user asks for always walk the whole tree
+        self._checks_since_full_scan[folder] = 0
+        self.thread_pool.start(Task(self.check_folder, folder, True))
         self.refresh_folder_list()
 
     # View log with only specific folder information
@@ -559,53 +1385,25 @@ class FolderMonitorWidget(QWidget):
             return
 
         try:
-            with open(LOG_FILE, "r") as f:
-                lines = f.readlines()
-
-            # Find the most recent snapshot and check entries
-            snapshot_entry = None
-            check_entry = None
-            snapshot_details = []
-            check_details = []
-
-            i = 0
-            while i < len(lines):
-                line = lines[i]
-                if folder in line:
-                    if "Snapshot" in line:
-                        snapshot_entry = line
-                        # Collect subsequent non-timestamped lines as details
-                        i += 1
-                        while i < len(lines) and not lines[i].startswith("["):
-                            snapshot_details.append(lines[i])
-                            i += 1
-                        continue
-                    elif "Changes" in line or "No changes" in line:
-                        check_entry = line
-                        # Collect subsequent non-timestamped lines as details
-                        i += 1
-                        while i < len(lines) and not lines[i].startswith("["):
-                            check_details.append(lines[i])
-                            i += 1
-                        continue
-                i += 1
+            # Latest snapshot and check entries, located through the log index
+            snapshot_entry = read_log_entry(folder, "Snapshot")
+            check_entry = read_log_entry(folder, "Check")
 
             if not snapshot_entry and not check_entry:
                 QMessageBox.information(self, "No Entries", f"No log entries found for:\n{folder}")
                 return
 
             temp_path = STATE_DIR / f"logs_{Path(folder).name}.txt"
-            with open(temp_path, "w") as out:
+            # Entries are copied as-is, without a decode/encode round-trip
+            with open(temp_path, "wb") as out:
                 if snapshot_entry:
                     out.write(snapshot_entry)
-                    out.writelines(snapshot_details)
-                    out.write("\n")
+                    out.write(b"\n")
 
                 if check_entry:
                     out.write(check_entry)
-                    out.writelines(check_details)
 
-            os.system(f'xdg-open "{temp_path}"')
+            xdg_open(temp_path)
         except Exception as e:
             QMessageBox.critical(self, "Error", f"Failed to read log file:\n{e}")
 
@@ -613,120 +1411,182 @@ class FolderMonitorWidget(QWidget):
         if path.exists():
             try:
                 with open(path, "r") as f:
-                    return json.load(f)
+                    data = json.load(f)
+                self._saved_digests[path] = _digest(dump_json(data))
+                return data
             except Exception as e:
                 log(f"Error loading {path.name}: {e}")
         return {}
 
+    # Writes are atomic and skipped when the content is what was last loaded/saved
     def save_json(self, path, data):
         try:
-            with open(path, "w") as f:
-                json.dump(data, f)
+            payload = dump_json(data)
+            digest = _digest(payload)
+            if self._saved_digests.get(path) == digest:
+                return
+            atomic_write(path, payload)
+            self._saved_digests[path] = digest
         except Exception as e:
             log(f"Error saving {path.name}: {e}")
 
+    # Write-back for state that changes in bursts (check stamps): saves requested within
+    # SAVE_DELAY_MS are written once. flush_saves() runs on quit
+    def schedule_save(self, path, data):
+        self._pending_saves[path] = data
+        if not self._save_timer.isActive():
+            self._save_timer.start()
+
+    def flush_saves(self):
+        self._save_timer.stop()
+        pending, self._pending_saves = self._pending_saves, {}
+        for path, data in pending.items():
+            self.save_json(path, data)
+
+    # Called from workers: a cache miss is read from disk and handed to the GUI thread for caching
+    def get_snapshot(self, folder: str) -> dict:
+        snapshot = self.snapshots.get(folder)
+        if snapshot is None:
+            snapshot = load_snapshot(folder)
+            self.signals.snapshot_loaded.emit(folder, snapshot)
+        return snapshot
+
     def take_snapshot(self, folder_path: Path):
-        self.signals.operation_started.emit(str(folder_path))
-        self.executor.submit(self._snapshot_worker, folder_path)
+        self.signals.operations_changed.emit({str(folder_path)}, set())
+        self.thread_pool.start(Task(self._snapshot_worker, folder_path))
 
     def _snapshot_worker(self, folder_path: Path):
         try:
-            metadata = get_metadata(folder_path)
-            try:
-                self.snapshots_lock.lockForWrite()
-                self.snapshots[str(folder_path)] = metadata
-                self.save_json(SNAPSHOT_FILE, self.snapshots)
-            finally:
-                self.snapshots_lock.unlock()
+            # Changes made from here on are either in the new snapshot or reported by inotify
+            watched = self.watcher is not None and self.watcher.watch(str(folder_path))
+            if watched:
+                self.watcher.reset(str(folder_path))
+            metadata = get_metadata(folder_path, self.snapshots.get(str(folder_path)))
+            save_snapshot(str(folder_path), metadata)
+            self.signals.snapshot_taken.emit(str(folder_path), metadata)
+            if watched:
+                self.watcher.trust(str(folder_path))
             log(f"Snapshot updated for {folder_path}",
                 folder=str(folder_path),
                 operation_type="Snapshot")
         finally:
-            self.signals.operation_finished.emit(str(folder_path))
+            self._finished_operations.put(str(folder_path))
 
     def run_check_all(self):
         now = time.time()
         for folder in self.folder_intervals:
             self.last_check_times[folder] = now
-            self.signals.operation_started.emit(folder)
-            self.executor.submit(self.check_folder, folder)
-        self.save_json(LAST_CHECK_FILE, self.last_check_times)
+        self.signals.operations_changed.emit(set(self.folder_intervals), set())
+        for folder in self.folder_intervals:
+            self._checks_since_full_scan[folder] = 0
+            self.thread_pool.start(Task(self.check_folder, folder, True))
+        self.schedule_save(LAST_CHECK_FILE, self.last_check_times)
         self.refresh_folder_list()
 
     def check_due_folders(self):
         now = time.time()
-        updated = False
-        for folder, interval in self.folder_intervals.items():
-            last_time = self.last_check_times.get(folder, 0)
-            if now - last_time > interval:
+        due = [folder for folder, interval in self.folder_intervals.items()
+               if now - self.last_check_times.get(folder, 0) > interval]
+        if due:
+            for folder in due:
                 self.last_check_times[folder] = now
-                updated = True
-                self.signals.operation_started.emit(folder)
-                self.executor.submit(self.check_folder, folder)
-        if updated:
-            self.save_json(LAST_CHECK_FILE, self.last_check_times)
+            self.signals.operations_changed.emit(set(due), set())
+            for folder in due:
+                # Every FULL_SCAN_EVERY-th scheduled check walks the tree, whatever inotify says
+                checks = self._checks_since_full_scan.get(folder, 0)
+                full_scan = checks >= FULL_SCAN_EVERY
+                self._checks_since_full_scan[folder] = 0 if full_scan else checks + 1
+                self.thread_pool.start(Task(self.check_folder, folder, full_scan))
+            self.schedule_save(LAST_CHECK_FILE, self.last_check_times)
             self.refresh_folder_list()
 
-    def check_folder(self, folder: str):
+    def check_folder(self, folder: str, full_scan: bool = False):
         try:
             folder_path = Path(folder)
-            current = get_metadata(folder_path)
-            previous = self.snapshots.get(folder, {})
-
-            changed_files = []
-            for path, (mtime, size) in current.items():
-                if path not in previous:
-                    changed_files.append(f"NEW: {path}")
-                elif previous[path] != (mtime, size):
-                    changed_files.append(f"MODIFIED: {path}")
+            previous = self.get_snapshot(folder)
 
-            deleted = set(previous.keys()) - set(current.keys())
-            for path in deleted:
-                changed_files.append(f"DELETED: {path}")
+            dirty = self.watcher.dirty_paths(folder) if self.watcher and not full_scan else None
+            if dirty is not None:
+                # Only what the kernel reported since the snapshot can differ from it
+                previous_subset, current = dirty_metadata(previous, dirty)
+                changed_files = diff_metadata(previous_subset, current)
+            else:
+                watched = self.watcher is not None and self.watcher.watch(folder)
+                changed_files, changed_paths = scan_and_diff(folder_path, previous)
+                if watched:
+                    # Seed the dirty set with what already differs, later checks can go incremental
+                    self.watcher.trust(folder, changed_paths)
 
             if changed_files:
-                self.folder_statuses[folder] = "changed"
-                log(f"Changes in {folder}:", folder=folder, operation_type="Check")
-                for line in changed_files:
-                    # Add details without timestamps (they'll be associated with the parent entry)
-                    with open(LOG_FILE, "a") as f:
-                        f.write(f"  {line}\n")
+                self.signals.status_changed.emit(folder, "changed")
+                # Details are written without timestamps, right after the parent entry
+                log(f"Changes in {folder}:", folder=folder, operation_type="Check",
+                    details=changed_files)
             else:
-                self.folder_statuses[folder] = "ok"
+                self.signals.status_changed.emit(folder, "ok")
                 log(f"No changes in {folder}", folder=folder, operation_type="Check")
         finally:
-            self.signals.operation_finished.emit(folder)
+            self._finished_operations.put(folder)
 
     def get_current_status(self):
         # Returns a string with current monitoring status
         status = []
         for folder in self.folder_intervals:
             last_check = self.last_check_times.get(folder, 0)
-            last_check_str = datetime.fromtimestamp(last_check).strftime("%Y-%m-%d %H:%M:%S") if last_check else "Never"
+            last_check_str = format_timestamp(int(last_check)) if last_check else "Never"
             status_str = self.folder_statuses.get(folder, "unknown")
             status.append(f"{folder} - Last check: {last_check_str} - Status: {status_str}")
         return "\n".join(status)
 
     # Issue with icon being incorrecly set after update snapshot
     def update_snapshots(self):
+        self.signals.operations_changed.emit(set(self.folder_intervals), set())
         for folder in self.folder_intervals:
-            self.signals.operation_started.emit(folder)
-            self.take_snapshot(Path(folder))
+            self.thread_pool.start(Task(self._snapshot_worker, Path(folder)))
 
     def open_log(self):
-        os.system(f"xdg-open '{LOG_FILE}'")
-
-    def on_operation_started(self, folder):
-        self.active_operations.add(folder)
+        xdg_open(LOG_FILE)
+
+    def on_operations_changed(self, started, finished):
+        self.active_operations |= started
+        self.active_operations -= finished
+        if not self.active_operations:
+            self._operations_timer.stop()
+        elif not self._operations_timer.isActive():
+            self._operations_timer.start()
         self.refresh_folder_list()
 
-    def on_operation_finished(self, folder):
-        self.active_operations.discard(folder)
-        self.refresh_folder_list()
+    def _drain_finished_operations(self):
+        finished = set()
+        while True:
+            try:
+                finished.add(self._finished_operations.get_nowait())
+            except queue.Empty:
+                break
+        if finished:
+            self.signals.operations_changed.emit(set(), finished)
+
+    def on_snapshot_taken(self, folder, metadata):
+        if folder in self.folder_intervals:
+            self.snapshots[folder] = metadata
+
+    def on_status_changed(self, folder, status):
+        if folder in self.folder_intervals:
+            self.folder_statuses[folder] = status
+            self.refresh_folder_list()
+
+    def on_snapshot_loaded(self, folder, metadata):
+        # A snapshot taken while the file was being read wins
+        if folder in self.folder_intervals:
+            self.snapshots.setdefault(folder, metadata)
 
 if __name__ == "__main__":
     app = QApplication(sys.argv)
     win = FolderMonitorWidget(selected_platform)
     win.show()
     app.aboutToQuit.connect(win.save_window_state)
+    app.aboutToQuit.connect(win.flush_saves)
+    app.aboutToQuit.connect(compact_log)
+    if win.watcher:
+        app.aboutToQuit.connect(win.watcher.stop)
     sys.exit(app.exec_())